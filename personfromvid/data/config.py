@@ -4,20 +4,23 @@ This module defines configuration classes and default settings for the video pro
 pipeline, with support for environment variable overrides and validation.
 """
 
+from __future__ import annotations
+
 import os
+import functools
 from pathlib import Path
-from typing import Dict, Any, Optional, List
-from dataclasses import dataclass, field
+from typing import Any, Optional, Literal
 from enum import Enum
-import yaml
-from pydantic import BaseModel, Field, field_validator, field_serializer, ConfigDict
-from platformdirs import user_cache_dir
+from pydantic import BaseModel, Field, ConfigDict, model_validator
 
 # Configuration constants
 DEFAULT_CONFIDENCE_THRESHOLD = 0.3
 DEFAULT_BATCH_SIZE = 1
 DEFAULT_JPEG_QUALITY = 95
 
+# Build validators/serializers on first use rather than at import time
+_DEFERRED_BUILD = ConfigDict(defer_build=True)
+
 
 class ModelType(str, Enum):
     """Supported AI model types."""
@@ -45,9 +48,19 @@ class DeviceType(str, Enum):
     AUTO = "auto"
 
 
+# Field types validated by literal membership rather than an enum constructor call.
+# Both enum members and their string values are accepted and stored as members.
+DeviceName = Literal[DeviceType.CPU, DeviceType.GPU, DeviceType.AUTO]
+LogLevelName = Literal[
+    LogLevel.DEBUG, LogLevel.INFO, LogLevel.WARNING, LogLevel.ERROR, LogLevel.CRITICAL
+]
+
+
 class ModelConfig(BaseModel):
     """Configuration for AI models."""
 
+    model_config = _DEFERRED_BUILD
+
     face_detection_model: str = Field(
         default="yolov8s-face", description="Face detection model name"
     )
@@ -57,7 +70,7 @@ class ModelConfig(BaseModel):
     head_pose_model: str = Field(
         default="sixdrepnet", description="Head pose estimation model name"
     )
-    device: DeviceType = Field(
+    device: DeviceName = Field(
         default=DeviceType.AUTO, description="Computation device preference"
     )
     batch_size: int = Field(
@@ -73,17 +86,12 @@ class ModelConfig(BaseModel):
         description="Minimum confidence threshold for detections",
     )
 
-    @field_serializer("device")
-    def serialize_device(self, value) -> str:
-        """Serialize DeviceType enum to string for JSON."""
-        if isinstance(value, DeviceType):
-            return value.value
-        return str(value)
-
 
 class FrameExtractionConfig(BaseModel):
     """Configuration for frame extraction."""
 
+    model_config = _DEFERRED_BUILD
+
     temporal_sampling_interval: float = Field(
         default=0.25,
         ge=0.1,
@@ -109,6 +117,8 @@ class FrameExtractionConfig(BaseModel):
 class QualityConfig(BaseModel):
     """Configuration for image quality assessment."""
 
+    model_config = _DEFERRED_BUILD
+
     blur_threshold: float = Field(
         default=100.0,
         ge=10.0,
@@ -131,6 +141,8 @@ class QualityConfig(BaseModel):
 class PoseClassificationConfig(BaseModel):
     """Configuration for pose classification."""
 
+    model_config = _DEFERRED_BUILD
+
     standing_hip_knee_angle_min: float = Field(
         default=160.0,
         ge=120.0,
@@ -166,6 +178,8 @@ class PoseClassificationConfig(BaseModel):
 class HeadAngleConfig(BaseModel):
     """Configuration for head angle classification."""
 
+    model_config = _DEFERRED_BUILD
+
     yaw_threshold_degrees: float = Field(
         default=22.5,
         ge=10.0,
@@ -192,6 +206,8 @@ class HeadAngleConfig(BaseModel):
 class CloseupDetectionConfig(BaseModel):
     """Configuration for closeup detection."""
 
+    model_config = _DEFERRED_BUILD
+
     extreme_closeup_threshold: float = Field(
         default=0.25,
         ge=0.15,
@@ -234,6 +250,8 @@ class CloseupDetectionConfig(BaseModel):
 class FrameSelectionConfig(BaseModel):
     """Configuration for frame selection."""
 
+    model_config = _DEFERRED_BUILD
+
     min_quality_threshold: float = Field(
         default=0.2,
         ge=0.0,
@@ -259,23 +277,22 @@ class FrameSelectionConfig(BaseModel):
         description="Minimum diversity score to avoid selecting similar frames",
     )
 
-    @field_validator("face_size_weight", "quality_weight")
-    @classmethod
-    def validate_weights_sum(cls, v, info):
+    @model_validator(mode="after")
+    def validate_weights_sum(self) -> FrameSelectionConfig:
         """Ensure face_size_weight and quality_weight don't exceed 1.0 when combined."""
-        if info.field_name == "quality_weight":
-            # Get face_size_weight from values if it exists
-            face_size_weight = info.data.get("face_size_weight", 0.3)
-            if v + face_size_weight > 1.0:
-                raise ValueError(
-                    f"face_size_weight ({face_size_weight}) + quality_weight ({v}) must not exceed 1.0"
-                )
-        return v
+        if self.face_size_weight + self.quality_weight > 1.0:
+            raise ValueError(
+                f"face_size_weight ({self.face_size_weight}) + quality_weight "
+                f"({self.quality_weight}) must not exceed 1.0"
+            )
+        return self
 
 
 class PngConfig(BaseModel):
     """Configuration for PNG output."""
 
+    model_config = _DEFERRED_BUILD
+
     optimize: bool = Field(
         True, description="Enable PNG optimization for smaller file sizes."
     )
@@ -284,6 +301,8 @@ class PngConfig(BaseModel):
 class JpegConfig(BaseModel):
     """Configuration for JPEG output."""
 
+    model_config = _DEFERRED_BUILD
+
     quality: int = Field(
         95, ge=70, le=100, description="Quality for JPEG images (1-100)."
     )
@@ -292,6 +311,8 @@ class JpegConfig(BaseModel):
 class OutputImageConfig(BaseModel):
     """Configuration for output generation."""
 
+    model_config = _DEFERRED_BUILD
+
     format: str = Field(
         "jpeg", description="The output image format ('png' or 'jpeg')."
     )
@@ -318,6 +339,8 @@ class OutputImageConfig(BaseModel):
 class OutputConfig(BaseModel):
     """Configuration for output generation."""
 
+    model_config = _DEFERRED_BUILD
+
     min_frames_per_category: int = Field(
         default=3,
         ge=1,
@@ -331,11 +354,24 @@ class OutputConfig(BaseModel):
     image: OutputImageConfig = Field(default_factory=OutputImageConfig)
 
 
+@functools.lru_cache(maxsize=1)
+def _default_cache_directory() -> Path:
+    """Get the platform-specific default cache directory.
+
+    Paths are immutable, so a single instance is shared by every StorageConfig.
+    """
+    from platformdirs import user_cache_dir
+
+    return Path(user_cache_dir("personfromvid", "codeprimate"))
+
+
 class StorageConfig(BaseModel):
     """Configuration for storage and caching."""
 
+    model_config = _DEFERRED_BUILD
+
     cache_directory: Path = Field(
-        default_factory=lambda: Path(user_cache_dir("personfromvid", "codeprimate")),
+        default_factory=_default_cache_directory,
         description="Directory for model and data caching",
     )
     temp_directory: Optional[Path] = Field(
@@ -359,23 +395,12 @@ class StorageConfig(BaseModel):
         default=5.0, ge=0.5, le=50.0, description="Maximum cache size in GB"
     )
 
-    @field_validator("cache_directory", "temp_directory", mode="before")
-    @classmethod
-    def convert_path(cls, v):
-        """Convert string paths to Path objects."""
-        if v is None:
-            return v
-        return Path(v) if not isinstance(v, Path) else v
-
-    @field_serializer("cache_directory", "temp_directory")
-    def serialize_path(self, value: Optional[Path]) -> Optional[str]:
-        """Serialize Path objects to strings for JSON."""
-        return str(value) if value is not None else None
-
 
 class ProcessingConfig(BaseModel):
     """Configuration for processing behavior."""
 
+    model_config = _DEFERRED_BUILD
+
     enable_resume: bool = Field(
         default=True, description="Enable processing resumption from checkpoints"
     )
@@ -395,7 +420,9 @@ class ProcessingConfig(BaseModel):
 class LoggingConfig(BaseModel):
     """Configuration for logging."""
 
-    level: LogLevel = Field(default=LogLevel.INFO, description="Logging level")
+    model_config = _DEFERRED_BUILD
+
+    level: LogLevelName = Field(default=LogLevel.INFO, description="Logging level")
     enable_file_logging: bool = Field(
         default=False, description="Enable logging to file"
     )
@@ -411,26 +438,6 @@ class LoggingConfig(BaseModel):
     )
     verbose: bool = Field(default=False, description="Enable verbose logging")
 
-    @field_serializer("level")
-    def serialize_level(self, value) -> str:
-        """Serialize LogLevel enum to string for JSON."""
-        if isinstance(value, LogLevel):
-            return value.value
-        return str(value)
-
-    @field_validator("log_file", mode="before")
-    @classmethod
-    def convert_log_path(cls, v):
-        """Convert string paths to Path objects."""
-        if v is None:
-            return v
-        return Path(v) if not isinstance(v, Path) else v
-
-    @field_serializer("log_file")
-    def serialize_log_path(self, value: Optional[Path]) -> Optional[str]:
-        """Serialize Path objects to strings for JSON."""
-        return str(value) if value is not None else None
-
 
 class Config(BaseModel):
     """Main configuration class combining all settings."""
@@ -457,32 +464,17 @@ class Config(BaseModel):
     model_config = ConfigDict(
         env_prefix="PERSONFROMVID_",
         env_nested_delimiter="__",
-        validate_assignment=True,
         arbitrary_types_allowed=True,
+        defer_build=True,
     )
 
     @classmethod
-    def from_file(cls, config_path: Path) -> "Config":
+    def from_file(cls, config_path: Path) -> Config:
         """Load configuration from YAML or JSON file."""
-        if not config_path.exists():
-            raise FileNotFoundError(f"Configuration file not found: {config_path}")
-
-        with open(config_path, "r", encoding="utf-8") as f:
-            if config_path.suffix.lower() in [".yaml", ".yml"]:
-                data = yaml.safe_load(f)
-            elif config_path.suffix.lower() == ".json":
-                import json
-
-                data = json.load(f)
-            else:
-                raise ValueError(
-                    f"Unsupported config file format: {config_path.suffix}"
-                )
-
-        return cls(**data)
+        return cls(**_read_config_file(config_path))
 
     @classmethod
-    def from_env(cls) -> "Config":
+    def from_env(cls) -> Config:
         """Load configuration with environment variable overrides."""
         return cls()
 
@@ -490,19 +482,19 @@ class Config(BaseModel):
         """Save configuration to YAML or JSON file."""
         config_path.parent.mkdir(parents=True, exist_ok=True)
 
-        data = self.dict()
+        data = self.model_dump(mode="json")
 
-        with open(config_path, "w", encoding="utf-8") as f:
-            if config_path.suffix.lower() in [".yaml", ".yml"]:
-                yaml.safe_dump(data, f, default_flow_style=False)
-            elif config_path.suffix.lower() == ".json":
-                import json
+        if config_path.suffix.lower() in [".yaml", ".yml"]:
+            import yaml
 
-                json.dump(data, f, indent=2, default=str)
-            else:
-                raise ValueError(
-                    f"Unsupported config file format: {config_path.suffix}"
-                )
+            with open(config_path, "w", encoding="utf-8") as f:
+                # Prefer the LibYAML-backed dumper when available
+                dumper = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+                yaml.dump(data, f, Dumper=dumper, default_flow_style=False)
+        elif config_path.suffix.lower() == ".json":
+            config_path.write_text(self.model_dump_json(indent=2), encoding="utf-8")
+        else:
+            raise ValueError(f"Unsupported config file format: {config_path.suffix}")
 
     def create_directories(self) -> None:
         """Create necessary directories based on configuration."""
@@ -514,38 +506,93 @@ class Config(BaseModel):
         if self.logging.log_file:
             self.logging.log_file.parent.mkdir(parents=True, exist_ok=True)
 
-    def validate_system_requirements(self) -> List[str]:
-        """Validate system requirements and return list of issues."""
-        issues = []
-
-        # Check available disk space
-        import shutil
-
-        try:
-            cache_space = shutil.disk_usage(self.storage.cache_directory.parent)
-            available_gb = cache_space.free / (1024**3)
-            if available_gb < self.storage.max_cache_size_gb:
-                issues.append(
-                    f"Insufficient disk space. Available: {available_gb:.1f}GB, "
-                    f"Required: {self.storage.max_cache_size_gb}GB"
-                )
-        except Exception as e:
-            issues.append(f"Could not check disk space: {e}")
+    def validate_system_requirements(self) -> list[str]:
+        """Validate system requirements and return list of issues.
+
+        Results are cached per cache directory and size budget, so repeated
+        calls do not touch the disk again.
+        """
+        return list(
+            _check_system_requirements(
+                self.storage.cache_directory, self.storage.max_cache_size_gb
+            )
+        )
+
+
+@functools.lru_cache(maxsize=4)
+def _check_system_requirements(cache_dir: Path, budget_gb: float) -> tuple[str, ...]:
+    """Check disk space and writability of the cache directory."""
+    issues = []
+
+    # Check available disk space
+    try:
+        available_gb = _available_disk_space(cache_dir.parent) / (1024**3)
+        if available_gb < budget_gb:
+            issues.append(
+                f"Insufficient disk space. Available: {available_gb:.1f}GB, "
+                f"Required: {budget_gb}GB"
+            )
+    except Exception as e:
+        issues.append(f"Could not check disk space: {e}")
+
+    # Check if required directories are writable
+    try:
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        test_file = cache_dir / ".write_test"
+        test_file.touch()
+        test_file.unlink()
+    except Exception as e:
+        issues.append(f"Cache directory not writable: {e}")
+
+    return tuple(issues)
+
+
+def _available_disk_space(path: Path) -> int:
+    """Get free disk space in bytes available to the current user."""
+    if hasattr(os, "statvfs"):
+        stats = os.statvfs(path)
+        return stats.f_bavail * stats.f_frsize
+
+    import shutil
+
+    return shutil.disk_usage(path).free
+
+
+def _read_config_file(config_path: Path) -> dict[str, Any]:
+    """Read raw configuration data from a YAML or JSON file."""
+    if not config_path.exists():
+        raise FileNotFoundError(f"Configuration file not found: {config_path}")
+
+    with open(config_path, "r", encoding="utf-8") as f:
+        if config_path.suffix.lower() in [".yaml", ".yml"]:
+            import yaml
+
+            # Prefer the LibYAML-backed loader when available
+            loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+            data = yaml.load(f, Loader=loader)
+        elif config_path.suffix.lower() == ".json":
+            try:
+                import orjson
+            except ImportError:
+                import json
 
-        # Check if required directories are writable
-        try:
-            self.storage.cache_directory.mkdir(parents=True, exist_ok=True)
-            test_file = self.storage.cache_directory / ".write_test"
-            test_file.touch()
-            test_file.unlink()
-        except Exception as e:
-            issues.append(f"Cache directory not writable: {e}")
+                data = json.load(f)
+            else:
+                data = orjson.loads(f.read())
+        else:
+            raise ValueError(f"Unsupported config file format: {config_path.suffix}")
 
-        return issues
+    return data or {}
 
 
+@functools.lru_cache(maxsize=1)
 def get_default_config() -> Config:
-    """Get default configuration with environment variable overrides."""
+    """Get default configuration with environment variable overrides.
+
+    The result is cached and shared between callers, so it must be treated as
+    read-only. Use :func:`load_config` to get a fresh instance that can be
+    modified.
+    """
     return Config.from_env()
 
 
@@ -553,4 +600,4 @@ def load_config(config_path: Optional[Path] = None) -> Config:
     """Load configuration from file or use defaults with env overrides."""
     if config_path and config_path.exists():
         return Config.from_file(config_path)
-    return get_default_config()
+    return Config.from_env()
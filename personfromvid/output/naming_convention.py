@@ -4,18 +4,33 @@ This module implements the NamingConvention class that generates standardized,
 descriptive filenames for output images based on frame metadata.
 """
 
+from __future__ import annotations
+
 import logging
+import re
+import sys
 from pathlib import Path
-from typing import Dict, Set
-from collections import defaultdict
+from typing import Optional
 
 from ..data.frame_data import FrameData
 from ..data.context import ProcessingContext
 from ..utils.logging import get_logger
 
+# Translation table that strips characters not allowed in filenames
+_INVALID_CHARS_TABLE = str.maketrans("", "", '<>:"/\\|?*')
+
+# Generated filenames end with a rank, an optional sequence number and extension
+_FILENAME_PATTERN = re.compile(r".+_\d{3,}(?:_\d{3,})?\.[A-Za-z0-9]+")
+
 
 class NamingConvention:
-    """Generates consistent output filenames based on frame metadata."""
+    """Generates consistent output filenames based on frame metadata.
+
+    Instances are not thread-safe: collision counters are updated without a
+    lock. Parallel callers sharing an instance must each pass a distinct
+    ``worker_id``, which keeps their base filenames, and therefore their
+    counters, apart.
+    """
 
     def __init__(self, context: ProcessingContext):
         """Initialize naming convention.
@@ -26,11 +41,22 @@ class NamingConvention:
         self.video_base_name = context.video_base_name
         self.output_directory = context.output_directory
         self.logger = get_logger(__name__)
-        self._used_filenames: Set[str] = set()
-        self._sequence_counters: Dict[str, int] = defaultdict(int)
+        self._sequence_counters: dict[str, int] = {}
+        # Head direction and shot type of the most recent frame only; a frame's
+        # pose categories are named back to back by ImageWriter
+        self._last_frame_descriptors: Optional[tuple[FrameData, str, str]] = None
+
+        # Filename prefixes shared by every generated name
+        self._frame_prefix = f"{self.video_base_name}_"
+        self._face_prefix = f"{self.video_base_name}_face_"
 
     def get_full_frame_filename(
-        self, frame: FrameData, category: str, rank: int, extension: str = "png"
+        self,
+        frame: FrameData,
+        category: str,
+        rank: int,
+        extension: str = "png",
+        worker_id: Optional[int] = None,
     ) -> str:
         """Generate filename for full frame image.
 
@@ -39,30 +65,32 @@ class NamingConvention:
             category: Pose category (e.g., "standing", "sitting")
             rank: Rank within category (1, 2, 3)
             extension: File extension without dot
+            worker_id: Parallel worker generating the file (None if not parallel)
 
         Returns:
             Filename string
         """
-        # Get head direction from frame
-        head_direction = self._get_head_direction(frame)
-        shot_type = self._get_shot_type(frame)
+        # Get head direction and shot type from frame
+        head_direction, shot_type = self._get_frame_descriptors(frame)
 
         # Build base filename: video_pose_head-direction_shot-type_rank.ext
         base_parts = [
-            self.video_base_name,
-            category,
-            head_direction,
-            shot_type,
-            f"{rank:03d}",
+            part for part in (sys.intern(category), head_direction, shot_type) if part
         ]
+        base_parts.append(self._rank_token(rank, worker_id))
 
-        base_filename = "_".join(part for part in base_parts if part) + f".{extension}"
+        base_filename = f"{self._frame_prefix}{'_'.join(base_parts)}.{extension}"
 
         # Handle collisions
         return self._ensure_unique_filename(base_filename)
 
     def get_face_crop_filename(
-        self, frame: FrameData, head_angle: str, rank: int, extension: str = "png"
+        self,
+        frame: FrameData,
+        head_angle: str,
+        rank: int,
+        extension: str = "png",
+        worker_id: Optional[int] = None,
     ) -> str:
         """Generate filename for face crop image.
 
@@ -71,14 +99,15 @@ class NamingConvention:
             head_angle: Head angle category (e.g., "front", "profile_left")
             rank: Rank within category (1, 2, 3)
             extension: File extension without dot
+            worker_id: Parallel worker generating the file (None if not parallel)
 
         Returns:
             Filename string
         """
         # Build base filename: video_face_head-angle_rank.ext
-        base_parts = [self.video_base_name, "face", head_angle, f"{rank:03d}"]
-
-        base_filename = "_".join(base_parts) + f".{extension}"
+        head_angle = sys.intern(head_angle)
+        rank_token = self._rank_token(rank, worker_id)
+        base_filename = f"{self._face_prefix}{head_angle}_{rank_token}.{extension}"
 
         # Handle collisions
         return self._ensure_unique_filename(base_filename)
@@ -107,8 +136,7 @@ class NamingConvention:
             return False
 
         # Check for invalid characters
-        invalid_chars = '<>:"/\\|?*'
-        if any(char in filename for char in invalid_chars):
+        if filename.translate(_INVALID_CHARS_TABLE) != filename:
             return False
 
         # Check length (most filesystems support 255 chars)
@@ -119,7 +147,28 @@ class NamingConvention:
         if not filename.startswith(self.video_base_name):
             return False
 
-        return True
+        # Check rank, sequence number and extension suffix
+        return _FILENAME_PATTERN.fullmatch(filename) is not None
+
+    def _get_frame_descriptors(self, frame: FrameData) -> tuple[str, str]:
+        """Get head direction and shot type, reusing them for repeated frames.
+
+        Args:
+            frame: Frame data
+
+        Returns:
+            Tuple of head direction and shot type strings
+        """
+        cached = self._last_frame_descriptors
+        if cached is None or cached[0] is not frame:
+            cached = (
+                frame,
+                self._get_head_direction(frame),
+                self._get_shot_type(frame),
+            )
+            self._last_frame_descriptors = cached
+
+        return cached[1], cached[2]
 
     def _get_head_direction(self, frame: FrameData) -> str:
         """Extract head direction from frame data.
@@ -134,7 +183,7 @@ class NamingConvention:
             best_head_pose = frame.get_best_head_pose()
             if best_head_pose and best_head_pose.direction:
                 # Convert direction to filename-safe format
-                return best_head_pose.direction.replace(" ", "-").lower()
+                return sys.intern(best_head_pose.direction.replace(" ", "-").lower())
 
         return ""
 
@@ -151,40 +200,53 @@ class NamingConvention:
             # Get the best closeup detection
             for closeup in frame.closeup_detections:
                 if closeup.shot_type:
-                    return closeup.shot_type.replace(" ", "-").lower()
+                    return sys.intern(closeup.shot_type.replace(" ", "-").lower())
 
         return ""
 
+    @staticmethod
+    def _rank_token(rank: int, worker_id: Optional[int]) -> str:
+        """Format the rank, prefixed by the worker id when one is given.
+
+        Args:
+            rank: Rank within category
+            worker_id: Parallel worker id or None
+
+        Returns:
+            Rank token such as "001" or "w2_001"
+        """
+        if worker_id is None:
+            return f"{rank:03d}"
+        return f"w{worker_id}_{rank:03d}"
+
     def _ensure_unique_filename(self, base_filename: str) -> str:
         """Ensure filename is unique by adding sequence number if needed.
 
+        Base filenames always end with a rank, so a sequence suffix can never
+        recreate another base filename and a per-filename count is sufficient.
+
         Args:
             base_filename: Base filename to make unique
 
         Returns:
             Unique filename
         """
-        if base_filename not in self._used_filenames:
-            self._used_filenames.add(base_filename)
+        sequence = self._sequence_counters.get(base_filename, 0)
+        self._sequence_counters[base_filename] = sequence + 1
+
+        if sequence == 0:
             return base_filename
 
         # Extract name and extension
-        path = Path(base_filename)
-        name_without_ext = path.stem
-        extension = path.suffix
-
-        # Generate unique filename with sequence number
-        sequence = self._sequence_counters[name_without_ext] + 1
+        name_without_ext, dot, extension = base_filename.rpartition(".")
+        if not dot:
+            name_without_ext, extension = base_filename, ""
+        else:
+            extension = f".{extension}"
 
-        while True:
-            new_filename = f"{name_without_ext}_{sequence:03d}{extension}"
-            if new_filename not in self._used_filenames:
-                self._used_filenames.add(new_filename)
-                self._sequence_counters[name_without_ext] = sequence
-                return new_filename
-            sequence += 1
+        return f"{name_without_ext}_{sequence:03d}{extension}"
 
     def reset_counters(self) -> None:
-        """Reset filename counters (useful for testing)."""
-        self._used_filenames.clear()
+        """Reset filename counters and cached frame data (useful for testing)."""
         self._sequence_counters.clear()
+        self._last_frame_descriptors = None
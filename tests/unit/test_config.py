@@ -9,7 +9,8 @@ from personfromvid.data.config import (
     get_default_config,
     DEFAULT_CONFIDENCE_THRESHOLD,
     DEFAULT_BATCH_SIZE,
-    OutputImageConfig
+    OutputImageConfig,
+    load_config,
 )
 
 
@@ -91,6 +92,42 @@ def test_resize_config_invalid_values():
         config = OutputImageConfig(resize=-1)
 
 
+def test_frame_selection_weights_validation():
+    """Test that selection weights may not exceed 1.0 combined."""
+    from pydantic import ValidationError
+    from personfromvid.data.config import FrameSelectionConfig
+
+    config = FrameSelectionConfig(face_size_weight=0.4, quality_weight=0.6)
+    assert config.face_size_weight + config.quality_weight == 1.0
+
+    with pytest.raises(ValidationError):
+        FrameSelectionConfig(face_size_weight=0.5, quality_weight=0.7)
+
+
+def test_default_cache_directory_shared():
+    """Test that the default cache directory is computed once and shared."""
+    first = Config()
+    second = Config()
+
+    assert first.storage is not second.storage
+    assert first.storage.cache_directory is second.storage.cache_directory
+
+    second.storage.max_cache_size_gb = 10.0
+    assert first.storage.max_cache_size_gb == 5.0
+
+
+def test_storage_paths_coerced():
+    """Test that string paths are converted to Path objects."""
+    config = Config(
+        storage={"cache_directory": "/tmp/pfv-cache", "temp_directory": "/tmp/pfv"},
+        logging={"log_file": "/tmp/pfv.log"},
+    )
+
+    assert config.storage.cache_directory == Path("/tmp/pfv-cache")
+    assert config.storage.temp_directory == Path("/tmp/pfv")
+    assert config.logging.log_file == Path("/tmp/pfv.log")
+
+
 def test_config_environment_override():
     """Test environment variable override capability."""
     import os
@@ -131,5 +168,149 @@ def test_system_requirements_validation():
     assert isinstance(issues, list)
 
 
+def test_system_requirements_validation_cached(tmp_path):
+    """Test that system requirement checks are cached per cache directory."""
+    from unittest.mock import patch
+    from personfromvid.data import config as config_module
+
+    config = Config(storage={"cache_directory": tmp_path / "cache"})
+
+    with patch.object(
+        config_module, "_available_disk_space", return_value=100 * 1024**3
+    ) as mock_space:
+        assert config.validate_system_requirements() == []
+        issues = config.validate_system_requirements()
+        issues.append("caller mutation")
+        assert config.validate_system_requirements() == []
+
+    assert mock_space.call_count == 1
+    assert (tmp_path / "cache").is_dir()
+
+
+def test_config_file_roundtrip(tmp_path):
+    """Test loading a previously written YAML config file."""
+    config = Config()
+    config.logging.level = LogLevel.DEBUG
+    config.output.image.resize = 1024
+    config_path = tmp_path / "config.yaml"
+    config.to_file(config_path)
+
+    loaded = Config.from_file(config_path)
+
+    assert loaded.logging.level == LogLevel.DEBUG
+    assert isinstance(loaded.logging.level, LogLevel)
+    assert loaded.output.image.resize == 1024
+    assert isinstance(loaded.storage.cache_directory, Path)
+    assert loaded.storage.cache_directory == config.storage.cache_directory
+    assert loaded.output.image.jpeg.quality == config.output.image.jpeg.quality
+
+
+def test_device_and_level_values():
+    """Test that device and log level accept only the supported values."""
+    from pydantic import ValidationError
+
+    config = Config(models={"device": "gpu"}, logging={"level": "DEBUG"})
+    assert config.models.device == DeviceType.GPU
+    assert config.logging.level == LogLevel.DEBUG
+
+    assert isinstance(config.models.device, DeviceType)
+    assert isinstance(config.logging.level, LogLevel)
+
+    with pytest.raises(ValidationError):
+        Config(models={"device": "cuda"})
+
+    with pytest.raises(ValidationError):
+        Config(logging={"level": "VERBOSE"})
+
+
+def test_device_and_level_enum_members():
+    """Test that config fields accept enum members and dump them as strings."""
+    from personfromvid.data.config import ModelConfig, LoggingConfig
+
+    models = ModelConfig(device=DeviceType.GPU)
+    logging_config = LoggingConfig(level=LogLevel.DEBUG)
+    config = Config(logging={"level": LogLevel.DEBUG})
+
+    assert models.device is DeviceType.GPU
+    assert logging_config.level is LogLevel.DEBUG
+    assert config.logging.level is LogLevel.DEBUG
+    assert models.model_dump(mode="json")["device"] == "gpu"
+
+    config.logging.level = LogLevel.ERROR
+    assert Config.model_validate(config.model_dump()).logging.level is LogLevel.ERROR
+
+
+def test_config_to_json_file(tmp_path):
+    """Test saving configuration as JSON with enums and paths as strings."""
+    import json
+
+    config = Config()
+    config.models.device = DeviceType.GPU
+    config_path = tmp_path / "config.json"
+    config.to_file(config_path)
+
+    data = json.loads(config_path.read_text(encoding="utf-8"))
+    assert data["models"]["device"] == "gpu"
+    assert data["logging"]["level"] == "INFO"
+    assert data["storage"]["cache_directory"] == str(config.storage.cache_directory)
+
+    loaded = Config.from_file(config_path)
+    assert loaded.models.device == DeviceType.GPU
+
+
+def test_json_config_without_orjson(tmp_path):
+    """Test that JSON config files load with the stdlib json fallback."""
+    from unittest.mock import patch
+
+    config_path = tmp_path / "config.json"
+    config_path.write_text('{"models": {"batch_size": 8}}', encoding="utf-8")
+
+    with patch.dict("sys.modules", {"orjson": None}):
+        config = Config.from_file(config_path)
+
+    assert config.models.batch_size == 8
+    assert Config.from_file(config_path).models.batch_size == 8
+
+
+def test_from_file_rejects_invalid_values(tmp_path):
+    """Test that config files are fully validated."""
+    from pydantic import ValidationError
+
+    config_path = tmp_path / "config.json"
+    config_path.write_text('{"models": {"batch_size": 0}}', encoding="utf-8")
+
+    with pytest.raises(ValidationError):
+        Config.from_file(config_path)
+
+
+def test_deferred_schema_rebuild():
+    """Test that deferred config schemas can be (re)built on demand."""
+    from pydantic import ValidationError
+
+    Config.model_rebuild(force=True)
+    OutputImageConfig.model_rebuild(force=True)
+
+    config = Config(output={"image": {"resize": 512}})
+    assert config.output.image.resize == 512
+
+    with pytest.raises(ValidationError):
+        Config(output={"image": {"resize": 100}})
+
+
+def test_default_config_is_cached():
+    """Test that the default config is cached and load_config builds a new one."""
+    assert get_default_config() is get_default_config()
+
+    config = load_config()
+    assert config is not get_default_config()
+    assert config.logging is not get_default_config().logging
+    assert load_config() is not config
+
+    config.logging.level = LogLevel.DEBUG
+    config.output.image.resize = 512
+    assert get_default_config().logging.level == LogLevel.INFO
+    assert get_default_config().output.image.resize is None
+
+
 if __name__ == "__main__":
     pytest.main([__file__]) 
\ No newline at end of file
@@ -1,5 +1,6 @@
 """Unit tests for output generation components."""
 
+import copy
 import pytest
 import tempfile
 from pathlib import Path
@@ -12,7 +13,7 @@ from personfromvid.output.image_writer import ImageWriter
 from personfromvid.data import Config, ProcessingContext
 from personfromvid.data.config import OutputImageConfig, PngConfig, JpegConfig
 from personfromvid.data.frame_data import FrameData, SourceInfo, ImageProperties, SelectionInfo
-from personfromvid.data.detection_results import FaceDetection
+from personfromvid.data.detection_results import FaceDetection, HeadPoseResult, CloseupDetection
 from personfromvid.core import TempManager
 
 
@@ -109,6 +110,94 @@ class TestNamingConvention:
         filename = naming.get_face_crop_filename(sample_frame_data, "front", 1, "jpg")
         assert filename == "test_video_face_front_001.jpg"
 
+    def test_full_frame_filename_with_head_direction_and_shot_type(self, processing_context, sample_frame_data):
+        """Test full frame filename includes head direction and shot type."""
+        sample_frame_data.head_poses = [
+            HeadPoseResult(yaw=30.0, pitch=0.0, roll=0.0, confidence=0.9, direction="looking left")
+        ]
+        sample_frame_data.closeup_detections = [
+            CloseupDetection(is_closeup=True, shot_type="medium_closeup", confidence=0.8, face_area_ratio=0.1)
+        ]
+        naming = NamingConvention(context=processing_context)
+        filename = naming.get_full_frame_filename(sample_frame_data, "standing", 2, "jpg")
+        assert filename == "test_video_standing_looking-left_medium_closeup_002.jpg"
+
+    def test_filename_collisions_get_sequence_numbers(self, processing_context, sample_frame_data):
+        """Test repeated filenames get increasing sequence numbers."""
+        naming = NamingConvention(context=processing_context)
+        filenames = [
+            naming.get_full_frame_filename(sample_frame_data, "standing", 1, "png")
+            for _ in range(4)
+        ]
+        assert filenames == [
+            "test_video_standing_001.png",
+            "test_video_standing_001_001.png",
+            "test_video_standing_001_002.png",
+            "test_video_standing_001_003.png",
+        ]
+
+        naming.reset_counters()
+        filename = naming.get_full_frame_filename(sample_frame_data, "standing", 1, "png")
+        assert filename == "test_video_standing_001.png"
+
+    def test_frame_descriptors_computed_once(self, processing_context, sample_frame_data):
+        """Test head direction and shot type are reused only for the last frame."""
+        sample_frame_data.head_poses = [
+            HeadPoseResult(yaw=0.0, pitch=0.0, roll=0.0, confidence=0.9, direction="front")
+        ]
+        naming = NamingConvention(context=processing_context)
+
+        with patch.object(
+            sample_frame_data, "get_best_head_pose", wraps=sample_frame_data.get_best_head_pose
+        ) as mock_best_head_pose:
+            naming.get_full_frame_filename(sample_frame_data, "standing", 1, "png")
+            naming.get_full_frame_filename(sample_frame_data, "sitting", 1, "png")
+            assert mock_best_head_pose.call_count == 1
+
+            naming.reset_counters()
+            filename = naming.get_full_frame_filename(sample_frame_data, "standing", 1, "png")
+            assert mock_best_head_pose.call_count == 2
+
+            other_frame = copy.copy(sample_frame_data)
+            other_frame.head_poses = []
+            assert naming.get_full_frame_filename(
+                other_frame, "standing", 1, "png"
+            ) == "test_video_standing_001.png"
+            naming.get_full_frame_filename(sample_frame_data, "standing", 1, "png")
+            assert mock_best_head_pose.call_count == 3
+
+        assert filename == "test_video_standing_front_001.png"
+        assert naming._last_frame_descriptors[0] is sample_frame_data
+
+    def test_worker_id_filenames(self, processing_context, sample_frame_data):
+        """Test worker id is included in generated filenames."""
+        naming = NamingConvention(context=processing_context)
+        assert naming.get_full_frame_filename(
+            sample_frame_data, "standing", 1, "png", worker_id=0
+        ) == "test_video_standing_w0_001.png"
+        assert naming.get_full_frame_filename(
+            sample_frame_data, "standing", 1, "png", worker_id=1
+        ) == "test_video_standing_w1_001.png"
+        assert naming.get_face_crop_filename(
+            sample_frame_data, "front", 1, "jpg", worker_id=1
+        ) == "test_video_face_front_w1_001.jpg"
+        assert naming.get_full_frame_filename(
+            sample_frame_data, "standing", 1, "png"
+        ) == "test_video_standing_001.png"
+
+    def test_validate_filename(self, processing_context):
+        """Test filename validation rules."""
+        naming = NamingConvention(context=processing_context)
+        assert naming.validate_filename("test_video_standing_001.png")
+        assert naming.validate_filename("test_video_face_front_002_001.jpg")
+        assert not naming.validate_filename("test_video_standing.png")
+        assert not naming.validate_filename("test_video_standing_001")
+        assert not naming.validate_filename("")
+        assert not naming.validate_filename("other_standing_001.png")
+        assert not naming.validate_filename("test_video_" + "a" * 250 + ".png")
+        for char in '<>:"/\\|?*':
+            assert not naming.validate_filename(f"test_video_{char}_001.png")
+
 
 class TestImageWriter:
     """Tests for ImageWriter class."""